@@ -8,3 +8,4 @@ export const supabase = createClient(
 
 export const SOIL_PER_BATTERY = 1; // in meter square
 export const WATER_PER_BATTERY = 500; // in L
+export const MAX_LOG_BATCH_SIZE = 500; // records per POST /log/batch
@@ -1,11 +1,12 @@
 import express from 'express';
-import { logBattery, getLogs } from './routes/log.js';
+import { logBattery, logBatteryBatch, getLogs } from './routes/log.js';
 import { getStats } from './routes/stats.js';
 
 const router = express.Router();
 
 router.get('/log', getLogs);
 router.post('/log', logBattery);
+router.post('/log/batch', logBatteryBatch);
 router.get('/stats', getStats);
 
 export default router;
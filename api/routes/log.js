@@ -1,21 +1,33 @@
-import { supabase } from '../config.js';
-
-export const logBattery = async (req, res) => {
-  const { timestamp, amount, device_id } = req.body;
+import { supabase, MAX_LOG_BATCH_SIZE } from '../config.js';
 
+const validateRecord = ({ timestamp, amount }) => {
   if (!timestamp) {
-    return res.status(400).json({ error: 'Missing timestamp' });
+    return 'Missing timestamp';
   }
 
   if (amount && (typeof amount !== 'number' || amount < 1)) {
-    return res.status(400).json({ error: 'Invalid amount' });
+    return 'Invalid amount';
+  }
+
+  return null;
+};
+
+const toLogRow = ({ timestamp, amount, device_id }) => ({
+  timestamp: new Date(timestamp * 1000),
+  amount: amount || 1,
+  device_id: device_id || 'unknown',
+});
+
+export const logBattery = async (req, res) => {
+  const validationError = validateRecord(req.body);
+
+  if (validationError) {
+    return res.status(400).json({ error: validationError });
   }
 
-  const { error } = await supabase.from('battery_logs').insert({
-    timestamp: new Date(timestamp * 1000),
-    amount: amount || 1,
-    device_id: device_id || 'unknown',
-  });
+  const { error } = await supabase
+    .from('battery_logs')
+    .insert(toLogRow(req.body));
 
   if (error) {
     console.error('Database error:', error);
@@ -25,6 +37,38 @@ export const logBattery = async (req, res) => {
   res.json({ ok: true });
 };
 
+export const logBatteryBatch = async (req, res) => {
+  const { records } = req.body;
+
+  if (!Array.isArray(records) || records.length === 0) {
+    return res.status(400).json({ error: 'Missing records' });
+  }
+
+  if (records.length > MAX_LOG_BATCH_SIZE) {
+    return res.status(400).json({ error: 'Too many records' });
+  }
+
+  for (const record of records) {
+    const validationError = validateRecord(record || {});
+
+    if (validationError) {
+      return res.status(400).json({ error: validationError });
+    }
+  }
+
+  // Single insert so the whole batch is stored or rejected together
+  const { error } = await supabase
+    .from('battery_logs')
+    .insert(records.map(toLogRow));
+
+  if (error) {
+    console.error('Database error:', error);
+    return res.status(500).json({ error: 'Failed to log battery data' });
+  }
+
+  res.json({ ok: true, count: records.length });
+};
+
 export const getLogs = async (req, res) => {
   const { data, error } = await supabase
     .from('battery_logs')
@@ -5,6 +5,7 @@ Test runner for Battery Counter API
 import requests
 from .test_root import test_root
 from .test_log import test_log_battery
+from .test_log_batch import test_log_battery_batch
 from .test_logs import test_get_logs
 from .test_stats import test_get_stats
 
@@ -28,10 +29,14 @@ def run_all_tests():
     results.append(("Log multiple batteries", test_log_battery(
         amount=5, device_id="test_pico")))
 
-    # Test 4: Get logs
+    # Test 4: Log a batch of batteries
+    results.append(("Log battery batch", test_log_battery_batch(
+        count=3, device_id="test_pico")))
+
+    # Test 5: Get logs
     results.append(("Get logs", test_get_logs()))
 
-    # Test 5: Get statistics
+    # Test 6: Get statistics
     results.append(("Get statistics", test_get_stats()))
 
     # Print summary
@@ -0,0 +1,34 @@
+"""
+Test for batch battery logging endpoint
+"""
+
+import requests
+import time
+from .config import API_BASE_URL
+
+
+def test_log_battery_batch(count=3, device_id="test_device"):
+    """Test logging several battery records in one request"""
+    print(f"Testing POST /log/batch (count={count}, device_id={device_id}) ...")
+
+    timestamp = int(time.time())
+    payload = {
+        "records": [
+            {
+                "timestamp": timestamp,
+                "amount": 1,
+                "device_id": device_id
+            }
+            for _ in range(count)
+        ]
+    }
+
+    response = requests.post(
+        f"{API_BASE_URL}/log/batch",
+        json=payload,
+        headers={"Content-Type": "application/json"}
+    )
+
+    print(f"Status: {response.status_code}")
+    print(f"Response: {response.json()}\n")
+    return response.status_code == 200
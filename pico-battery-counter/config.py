@@ -4,12 +4,16 @@ Configuration constants for the IR sensor battery counter
 
 # API Endpoints
 API_LOG = "https://asep-battery-counter-api.vercel.app/log"
+API_LOG_BATCH = "https://asep-battery-counter-api.vercel.app/log/batch"
 API_STATS = "https://asep-battery-counter-api.vercel.app/stats"
 
 # GPIO Configuration (BCM numbering)
 IR_PIN = 15
 LED_PIN = 14
 
+# GPIO character device used when libgpiod is installed
+GPIO_CHIP = "/dev/gpiochip0"
+
 # Limit switch GPIO
 LIMIT_SWITCH_PIN = 17
 
@@ -17,22 +21,30 @@ LIMIT_SWITCH_PIN = 17
 DEVICE_ID = "rpi4_1"
 
 # File Paths
-CACHE_FILE = "cache.json"
+CACHE_FILE = "cache.jsonl"  # Append-only, one JSON record per line
+LEGACY_CACHE_FILE = "cache.json"  # Old JSON array cache, migrated on start
+REJECTED_CACHE_FILE = "cache.rejected.jsonl"  # Records the API refused (400)
 
 # Network Configuration
 WIFI_CHECK_HOST = "8.8.8.8"
+WIFI_CHECK_PORT = 53  # TCP port connected to by the internet check (DNS)
 
 # Timing Configuration
 DEBOUNCE_MS = 100
 SYNC_INTERVAL_SECONDS = 5
-STATS_UPDATE_INTERVAL_LOOPS = 100
-MAIN_LOOP_SLEEP = 0.05
+SYNC_MAX_INTERVAL_SECONDS = 60  # Upper bound for the interval while offline
+SYNC_BATCH_SIZE = 128  # Records per upload request (API limit is 500)
+STATS_UPDATE_INTERVAL_SECONDS = 5
 
 # ToF Sensor Configuration
 TOF_I2C_BUS = 1
 TOF_ADDRESS = 0x29
 TOF_XSHUT_PIN = 17
 TOF_THRESHOLD_MM = 15
+TOF_INT_PIN = None  # GPIO wired to the sensor's GPIO1 output (None = poll)
+
+# Logging level for the service loops ("DEBUG" shows per-press and per-tick messages)
+LOG_LEVEL = "INFO"
 
 # Display Configuration
 SHOW_DISTANCE_MEASUREMENT = False
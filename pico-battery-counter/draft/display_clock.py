@@ -9,7 +9,7 @@ import time
 import sys
 import os
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 # Add parent directory to Python path to allow imports from utils
 try:
@@ -36,27 +36,13 @@ ROTATIONS = [0, 90, 180, 270]
 ROTATION = ROTATIONS[3]  # Rotate 90 degrees to the left (landscape)
 
 
-def draw_clock(width, height):
+def load_fonts():
     """
-    Create an image with current date and time
-
-    Args:
-        width: Image width
-        height: Image height
+    Load the clock fonts once
 
     Returns:
-        PIL Image with clock display
+        tuple: (time_font, date_font)
     """
-    # Create black background
-    image = Image.new('RGB', (width, height), (0, 0, 0))
-    draw = ImageDraw.Draw(image)
-
-    # Get current date and time
-    now = datetime.now()
-    time_str = now.strftime("%H:%M:%S")
-    date_str = now.strftime("%A, %B %d, %Y")
-
-    # Load fonts
     try:
         time_font = ImageFont.truetype(
             "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
@@ -67,6 +53,29 @@ def draw_clock(width, height):
         time_font = ImageFont.load_default()
         date_font = ImageFont.load_default()
 
+    return time_font, date_font
+
+
+def draw_clock(width, height, time_str, date_str, fonts):
+    """
+    Create an image with the given date and time
+
+    Args:
+        width: Image width
+        height: Image height
+        time_str: Formatted time to draw
+        date_str: Formatted date to draw
+        fonts: (time_font, date_font) tuple from load_fonts()
+
+    Returns:
+        PIL Image with clock display
+    """
+    # Create black background
+    image = Image.new('RGB', (width, height), (0, 0, 0))
+    draw = ImageDraw.Draw(image)
+
+    time_font, date_font = fonts
+
     # Calculate text positions for centering
     time_bbox = draw.textbbox((0, 0), time_str, font=time_font)
     time_width = time_bbox[2] - time_bbox[0]
@@ -114,16 +123,38 @@ def main():
 
         print("Starting clock display... Press Ctrl+C to exit.")
 
+        fonts = load_fonts()
+        last_image = None
+        last_day = None
+        date_str = ""
+
         # Update clock every second
         while True:
-            # Draw clock image
-            clock_image = draw_clock(display.width, display.height)
+            now = datetime.now()
+            time_str = now.strftime("%H:%M:%S")
 
-            # Display on screen
-            display.display_image(clock_image)
+            # The date string only changes at midnight
+            if now.day != last_day:
+                date_str = now.strftime("%A, %B %d, %Y")
+                last_day = now.day
 
-            # Wait until next second
-            time.sleep(1)
+            # Draw clock image
+            clock_image = draw_clock(
+                display.width, display.height, time_str, date_str, fonts)
+
+            # Send only the rectangle that changed since the last frame -
+            # usually just the last digit or two of the time
+            if last_image is None:
+                display.display_image(clock_image)
+            else:
+                bbox = ImageChops.difference(clock_image, last_image).getbbox()
+                if bbox is not None:
+                    display.display_region(
+                        clock_image.crop(bbox), bbox[0], bbox[1])
+            last_image = clock_image
+
+            # Wait until the start of the next second
+            time.sleep(1 - (time.time() % 1))
 
     except KeyboardInterrupt:
         print("\nExiting...")
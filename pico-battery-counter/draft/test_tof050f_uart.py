@@ -5,9 +5,67 @@ Protocol: 115200 baud, 8N1, Modbus RTU
 """
 
 import serial
+import sys
 import time
 import struct
 
+try:
+    from crcmod.predefined import mkPredefinedCrcFun
+except ImportError:
+    mkPredefinedCrcFun = None
+
+
+# Number of sample rows buffered before writing them to stdout in one call
+PRINT_BATCH_SIZE = 50
+
+# Row template for the continuous reading output, built once at import
+ROW_FORMAT = "[%04d] Distance: %4d mm\n"
+
+# Distance response frame: addr + func + count + 2 data + 2 crc
+RESPONSE_LENGTH = 7
+
+# Output interval used when streaming distances in continuous mode
+STREAM_INTERVAL_MS = 50
+
+# Serial timeouts: read() returns as soon as a full frame is in, or once
+# the line has been idle for INTER_BYTE_TIMEOUT mid-frame (Modbus RTU ends
+# a frame after 3.5 idle char-times, ~0.3 ms at 115200 baud)
+READ_TIMEOUT = 0.02
+INTER_BYTE_TIMEOUT = 0.002
+
+# Register writes are acknowledged more slowly than reads
+WRITE_REPLY_TIMEOUT = 0.1
+
+
+def _build_crc_table():
+    """Build the 256-entry CRC-16/MODBUS lookup table (reflected 0xA001)"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+_MODBUS_CRC_TABLE = _build_crc_table()
+
+# Native CRC-16/MODBUS from crcmod's C extension when installed,
+# otherwise the table-driven loop in TOF050FSerial._calc_crc is used
+_crc16_modbus = (mkPredefinedCrcFun('modbus')
+                 if mkPredefinedCrcFun is not None else None)
+
+
+def _flush_lines(lines):
+    """Write buffered output lines to stdout in a single call"""
+    if lines:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+        lines.clear()
+
 
 class TOF050FSerial:
     """
@@ -28,6 +86,13 @@ class TOF050FSerial:
         self.baudrate = baudrate
         self.slave_addr = slave_addr
 
+        # Whether the previous read_distance() got a valid frame; stale
+        # bytes are only flushed from the input buffer after a bad read
+        self._last_ok = True
+
+        # The distance read command never changes, so build its frame once
+        self._cmd_read_distance = bytes(self._build_read_command(0x0010, 1))
+
         try:
             self.serial = serial.Serial(
                 port=port,
@@ -35,7 +100,8 @@ class TOF050FSerial:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1.0
+                timeout=READ_TIMEOUT,
+                inter_byte_timeout=INTER_BYTE_TIMEOUT
             )
             print(f"TOF050F initialized on {port} at {baudrate} baud")
             print(f"Slave address: 0x{slave_addr:02X}")
@@ -45,16 +111,23 @@ class TOF050FSerial:
 
     def _calc_crc(self, data):
         """Calculate CRC-16/MODBUS checksum"""
+        if _crc16_modbus is not None:
+            return _crc16_modbus(bytes(data))
+
+        table = _MODBUS_CRC_TABLE
         crc = 0xFFFF
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
         return crc
 
+    def _calc_crc_bytes(self, data):
+        """Calculate CRC-16/MODBUS checksum as the 2 trailing frame bytes"""
+        return struct.pack('<H', self._calc_crc(data))
+
+    def _crc_ok(self, frame):
+        """Check the trailing CRC (low byte first) of a response frame"""
+        return self._calc_crc(frame[:-2]) == (frame[-2] | (frame[-1] << 8))
+
     def _build_read_command(self, reg_addr, num_words=1):
         """Build Modbus read command"""
         cmd = bytearray([
@@ -65,9 +138,7 @@ class TOF050FSerial:
             (num_words >> 8) & 0xFF,  # Number of words high
             num_words & 0xFF           # Number of words low
         ])
-        crc = self._calc_crc(cmd)
-        cmd.append(crc & 0xFF)         # CRC low
-        cmd.append((crc >> 8) & 0xFF)  # CRC high
+        cmd += self._calc_crc_bytes(cmd)  # CRC low, CRC high
         return cmd
 
     def _build_write_command(self, reg_addr, value):
@@ -80,11 +151,17 @@ class TOF050FSerial:
             (value >> 8) & 0xFF,      # Data high
             value & 0xFF               # Data low
         ])
-        crc = self._calc_crc(cmd)
-        cmd.append(crc & 0xFF)         # CRC low
-        cmd.append((crc >> 8) & 0xFF)  # CRC high
+        cmd += self._calc_crc_bytes(cmd)  # CRC low, CRC high
         return cmd
 
+    def _read_reply(self, length, timeout):
+        """Read a reply frame using a longer timeout than sample reads"""
+        self.serial.timeout = timeout
+        try:
+            return self.serial.read(length)
+        finally:
+            self.serial.timeout = READ_TIMEOUT
+
     def read_distance(self):
         """
         Read distance measurement
@@ -94,27 +171,29 @@ class TOF050FSerial:
             int: Distance in millimeters, or -1 on error
         """
         try:
-            # Clear buffers
-            self.serial.reset_input_buffer()
-            self.serial.reset_output_buffer()
+            # Drop stale bytes left over from a failed read
+            if not self._last_ok:
+                self.serial.reset_input_buffer()
+            self._last_ok = False
 
             # Send read command for register 0x0010
-            cmd = self._build_read_command(0x0010, 1)
-            self.serial.write(cmd)
+            self.serial.write(self._cmd_read_distance)
 
-            # Wait for response (7 bytes: addr + func + count + 2 data + 2 crc)
-            time.sleep(0.05)
-            response = self.serial.read(7)
+            # Response is 7 bytes: addr + func + count + 2 data + 2 crc
+            response = self.serial.read(RESPONSE_LENGTH)
 
-            if len(response) < 7:
+            if len(response) < RESPONSE_LENGTH:
                 return -1
 
             # Verify response
             if response[0] != self.slave_addr or response[1] != 0x03:
                 return -1
+            if not self._crc_ok(response):
+                return -1
 
             # Extract distance (bytes 3 and 4)
             distance = (response[3] << 8) | response[4]
+            self._last_ok = True
             return distance
 
         except Exception as e:
@@ -131,9 +210,7 @@ class TOF050FSerial:
         try:
             cmd = self._build_write_command(0x0004, mode)
             self.serial.write(cmd)
-            time.sleep(0.1)
-            response = self.serial.read(8)
-            return len(response) == 8
+            return len(self._read_reply(8, WRITE_REPLY_TIMEOUT)) == 8
         except Exception as e:
             print(f"Error setting mode: {e}")
             return False
@@ -148,13 +225,41 @@ class TOF050FSerial:
         try:
             cmd = self._build_write_command(0x0005, interval_ms)
             self.serial.write(cmd)
-            time.sleep(0.1)
-            response = self.serial.read(8)
-            return len(response) == 8
+            return len(self._read_reply(8, WRITE_REPLY_TIMEOUT)) == 8
         except Exception as e:
             print(f"Error setting continuous output: {e}")
             return False
 
+    def read_distances_available(self):
+        """
+        Drain the distance frames already received in continuous output mode
+        All complete frames waiting in the serial buffer are read in one call
+
+        Returns:
+            list: Distances in millimeters, oldest first (empty if none)
+        """
+        try:
+            frame_count = self.serial.in_waiting // RESPONSE_LENGTH
+            if frame_count == 0:
+                return []
+            data = self.serial.read(frame_count * RESPONSE_LENGTH)
+        except Exception as e:
+            print(f"Error reading frames: {e}")
+            return []
+
+        distances = []
+        for i in range(0, len(data) - RESPONSE_LENGTH + 1, RESPONSE_LENGTH):
+            if data[i] != self.slave_addr or data[i + 1] != 0x03:
+                # Lost frame alignment - drop buffered bytes and resync
+                self.serial.reset_input_buffer()
+                break
+            frame = data[i:i + RESPONSE_LENGTH]
+            if not self._crc_ok(frame):
+                # Corrupted frame - skip it
+                continue
+            distances.append((frame[3] << 8) | frame[4])
+        return distances
+
     def is_available(self):
         """Check if sensor responds"""
         distance = self.read_distance()
@@ -202,40 +307,56 @@ def test_continuous_reading(duration_seconds=10):
     print("\n=== TOF050F Continuous Reading Test (UART) ===")
     print(f"Duration: {duration_seconds} seconds\n")
 
+    # Buffer sample rows and write them in batches to keep stdout
+    # syscalls out of the sampling loop
+    lines = []
+    sensor = None
+    streaming = False
+
     try:
         sensor = TOF050FSerial()
 
         if not sensor.is_available():
             print("ERROR: Sensor not found!")
-            sensor.cleanup()
             return
 
         print("Sensor detected successfully!")
         print("Reading distances...\n")
 
+        # Let the sensor push frames on its own instead of polling it
+        streaming = True
+        sensor.set_continuous_output(STREAM_INTERVAL_MS)
+
         start_time = time.time()
         count = 0
 
         while (time.time() - start_time) < duration_seconds:
-            distance = sensor.read_distance()
+            for distance in sensor.read_distances_available():
+                lines.append(ROW_FORMAT % (count, distance))
+                count += 1
 
-            if distance >= 0:
-                print(f"[{count:04d}] Distance: {distance:4d} mm")
-            else:
-                print(f"[{count:04d}] Read error")
+            if len(lines) >= PRINT_BATCH_SIZE:
+                _flush_lines(lines)
 
-            count += 1
-            time.sleep(0.15)  # ~6-7 Hz sampling
+            time.sleep(STREAM_INTERVAL_MS / 1000.0)
+
+        _flush_lines(lines)
 
-        sensor.cleanup()
         print(
             f"\nTest completed: {count} readings in {time.time() - start_time:.2f} seconds")
 
     except KeyboardInterrupt:
+        _flush_lines(lines)
         print("\n\nTest interrupted by user")
-        sensor.cleanup()
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        if sensor is not None:
+            # Stop streaming even after Ctrl+C or an error, otherwise the
+            # frames corrupt every later request/response until power-cycled
+            if streaming:
+                sensor.set_continuous_output(0)
+            sensor.cleanup()
 
 
 def test_range_modes():
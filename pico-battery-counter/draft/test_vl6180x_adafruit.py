@@ -5,11 +5,40 @@ This script reads distance (range) and ambient light (lux) measurements from the
 """
 
 import time
+from collections import deque
 import board
 import busio
 import adafruit_vl6180x
 
 
+# Number of recent samples averaged into the smoothed readings
+SMOOTHING_WINDOW = 32
+
+
+class RunningAverage:
+    """Fixed-size moving average updated in O(1) per sample"""
+
+    def __init__(self, size):
+        self.samples = deque(maxlen=size)
+        self.total = 0
+
+    def add(self, value):
+        """
+        Add a sample and return the current average
+
+        Args:
+            value: New sample
+
+        Returns:
+            float: Average of the samples in the window
+        """
+        if len(self.samples) == self.samples.maxlen:
+            self.total -= self.samples[0]
+        self.samples.append(value)
+        self.total += value
+        return self.total / len(self.samples)
+
+
 def main():
     """Main function to initialize and read from VL6180X sensor."""
     try:
@@ -26,11 +55,14 @@ def main():
         print("VL6180X sensor initialized successfully!")
         print("Starting measurements... (Press Ctrl+C to stop)\n")
 
+        range_avg = RunningAverage(SMOOTHING_WINDOW)
+        lux_avg = RunningAverage(SMOOTHING_WINDOW)
+
         # Main loop: read range and lux every second
         while True:
             # Read the range in millimeters
             range_mm = sensor.range
-            print(f"Range: {range_mm}mm")
+            print(f"Range: {range_mm}mm (avg {range_avg.add(range_mm):.0f}mm)")
 
             # Read range status to check for errors
             status = sensor.range_status
@@ -43,7 +75,8 @@ def main():
             #   ALS_GAIN_1, ALS_GAIN_1_25, ALS_GAIN_1_67, ALS_GAIN_2_5,
             #   ALS_GAIN_5, ALS_GAIN_10, ALS_GAIN_20, ALS_GAIN_40
             light_lux = sensor.read_lux(adafruit_vl6180x.ALS_GAIN_1)
-            print(f"Light (1x gain): {light_lux}lux")
+            print(
+                f"Light (1x gain): {light_lux}lux (avg {lux_avg.add(light_lux):.2f}lux)")
 
             print("-" * 40)
 
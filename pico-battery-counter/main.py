@@ -7,16 +7,21 @@ Orchestrates two independent services:
 """
 
 import RPi.GPIO as GPIO
+import logging
+import logging.handlers
+import queue
 import signal
 import sys
 import time
 
 from utils.detection import DetectionService
 from utils.sync import start_sync_thread, stop_sync_thread
+from config import LOG_LEVEL
 
 
 # Global service instances
 detection_service = None
+log_listener = None
 
 
 def cleanup_handler(signum, frame):
@@ -33,6 +38,10 @@ def cleanup_handler(signum, frame):
     # Cleanup GPIO
     GPIO.cleanup()
 
+    # Write out any log records still queued
+    if log_listener is not None:
+        log_listener.stop()
+
     print("Shutdown complete")
     sys.exit(0)
 
@@ -41,7 +50,20 @@ def main():
     """
     Main application - starts both services and waits
     """
-    global detection_service
+    global detection_service, log_listener
+
+    # Log calls only enqueue the record; a listener thread formats and
+    # writes it, so the detection thread never blocks on stdout/journald
+    log_queue = queue.Queue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    log_listener.start()
 
     print("=" * 50)
     print("Battery Counter - Raspberry Pi 4")
@@ -102,6 +102,15 @@ enable_interfaces() {
     sudo raspi-config nonint do_spi 0
     print_success "SPI enabled"
     
+    # Raise the spidev transfer size so TFT frames need fewer SPI transfers
+    CMDLINE="/boot/firmware/cmdline.txt"
+    [ -f "$CMDLINE" ] || CMDLINE="/boot/cmdline.txt"
+    if [ -f "$CMDLINE" ] && ! grep -q "spidev.bufsiz" "$CMDLINE"; then
+        print_info "Setting spidev.bufsiz=65536..."
+        sudo sed -i '1 s/$/ spidev.bufsiz=65536/' "$CMDLINE"
+        print_success "spidev buffer size raised"
+    fi
+    
     print_warning "A reboot will be required after installation completes"
 }
 
@@ -248,7 +257,7 @@ create_requirements_file() {
 RPi.GPIO>=0.7.0
 spidev>=3.5
 smbus2>=0.4.0
-Pillow>=8.0.0
+Pillow>=9.2.0
 requests>=2.25.0
 EOF
     
@@ -4,13 +4,18 @@ Runs in its own thread to monitor sensor and update display without blocking
 """
 
 import RPi.GPIO as GPIO
+import logging
 import time
 import threading
-from config import LED_PIN, MAIN_LOOP_SLEEP, STATS_UPDATE_INTERVAL_LOOPS, SHOW_DISTANCE_MEASUREMENT
-from utils.sync import add_record, get_latest_stats, load_cache
+from config import LED_PIN, STATS_UPDATE_INTERVAL_SECONDS, SHOW_DISTANCE_MEASUREMENT
+from utils.sync import add_record, get_latest_stats, get_unsynced_count
 from utils.st7789_display import TFT
 from utils.limit_switch_sensor import LimitSwitchSensor
 
+# Messages from the detection loop go through logging so the per-tick ones
+# can be filtered out (DEBUG) without being formatted or written
+logger = logging.getLogger(__name__)
+
 
 class DetectionService:
     """
@@ -23,7 +28,9 @@ class DetectionService:
         self.thread = None
         self.sensor = None
         self.tft = None
-        self.loop_counter = 0
+
+        # Turns the LED back on after a detection blink
+        self._blink_timer = None
 
         # Local detection counter - incremented on detect, reset when stats update
         self.local_detections = 0
@@ -64,6 +71,21 @@ class DetectionService:
             print("Continuing without display...")
             self.tft = None
 
+    def _blink_led(self):
+        """
+        Briefly switch the LED off to indicate a detection
+        Returns immediately - a timer switches it back on, so the detection
+        loop handles the next press without waiting for the blink
+        """
+        if self._blink_timer is not None:
+            self._blink_timer.cancel()
+
+        GPIO.output(LED_PIN, GPIO.LOW)
+        self._blink_timer = threading.Timer(
+            0.1, GPIO.output, (LED_PIN, GPIO.HIGH))
+        self._blink_timer.daemon = True
+        self._blink_timer.start()
+
     def _update_display(self, current_distance=-1):
         """
         Update display with current stats + local detections
@@ -101,14 +123,17 @@ class DetectionService:
 
         current_distance = -1
 
+        # Refresh stats on the first pass, then every interval
+        stats_deadline = time.monotonic()
+
+        # LED stays on while monitoring - set once, not on every wake-up
+        GPIO.output(LED_PIN, GPIO.HIGH)
+
         try:
             while self.running:
-                # Turn LED on during active monitoring
-                GPIO.output(LED_PIN, GPIO.HIGH)
-
                 # Check for limit switch press
                 if self.sensor.check():
-                    print(f"\n*** BATTERY DETECTED! ***")
+                    logger.info("*** BATTERY DETECTED! ***")
 
                     # Increment local counter first (instant!)
                     self.local_detections += 1
@@ -118,16 +143,15 @@ class DetectionService:
 
                     # INSTANT DISPLAY UPDATE - uses local counter, no locks!
                     self._update_display(current_distance)
-                    print(f"Display updated instantly!")
+                    logger.debug("Display updated instantly!")
 
                     # Brief LED blink to indicate detection
-                    GPIO.output(LED_PIN, GPIO.LOW)
-                    time.sleep(0.1)
-                    GPIO.output(LED_PIN, GPIO.HIGH)
-                    time.sleep(0.1)
+                    self._blink_led()
 
                 # Periodic display update with latest stats (non-blocking)
-                if self.loop_counter % STATS_UPDATE_INTERVAL_LOOPS == 0:
+                if time.monotonic() >= stats_deadline:
+                    stats_deadline = time.monotonic() + STATS_UPDATE_INTERVAL_SECONDS
+
                     # Get latest stats from sync service (no network call!)
                     new_stats = get_latest_stats()
 
@@ -146,22 +170,20 @@ class DetectionService:
                     # Update display with latest stats
                     self._update_display(current_distance)
 
-                    unsynced = len(load_cache())
-                    print(
-                        f"Display updated: Total={self.max_total_shown}, Local={self.local_detections}, Unsynced={unsynced}")
-
-                # Turn LED off
-                GPIO.output(LED_PIN, GPIO.LOW)
-
-                # Increment loop counter
-                self.loop_counter += 1
+                    logger.debug("Display updated: Total=%s, Local=%s, Unsynced=%s",
+                                 self.max_total_shown, self.local_detections,
+                                 get_unsynced_count())
 
-                # Non-blocking sleep
-                time.sleep(MAIN_LOOP_SLEEP)
+                # Sleep until the next press or the next stats refresh
+                self.sensor.wait_for_press(
+                    max(0, stats_deadline - time.monotonic()))
 
         except Exception as e:
             print(f"Detection loop error: {e}")
         finally:
+            if self._blink_timer is not None:
+                self._blink_timer.cancel()
+            GPIO.output(LED_PIN, GPIO.LOW)
             print("Detection loop stopped")
 
     def start(self):
@@ -182,5 +204,7 @@ class DetectionService:
         """Stop the detection service thread"""
         print("Stopping detection service...")
         self.running = False
+        if self.sensor is not None:
+            self.sensor.wake()
         if self.thread is not None:
             self.thread.join(timeout=2)
@@ -3,13 +3,30 @@ Limit Switch Sensor Module for Raspberry Pi
 Handles GPIO-based limit switch detection
 """
 
+import logging
+import threading
 import time
+from datetime import timedelta
 try:
     import RPi.GPIO as GPIO
 except ImportError:
     GPIO = None
 
-from config import LIMIT_SWITCH_PIN, DEBOUNCE_MS
+try:
+    import gpiod
+    from gpiod.line import Bias, Direction, Edge, Value
+except ImportError:
+    gpiod = None
+
+from config import LIMIT_SWITCH_PIN, DEBOUNCE_MS, GPIO_CHIP
+
+logger = logging.getLogger(__name__)
+
+# Poll interval used by wait_for_press() when edge detection is unavailable
+FALLBACK_POLL_SECONDS = 0.01
+
+# How long the libgpiod event thread blocks before checking for cleanup()
+EVENT_WAIT_SECONDS = 1.0
 
 
 class LimitSwitchSensor:
@@ -27,19 +44,92 @@ class LimitSwitchSensor:
             debounce_ms: Debounce time in milliseconds
         """
         self.pin = pin
-        self.debounce_time = debounce_ms / 1000.0  # Convert to seconds
-        self.last_trigger_time = 0
+        self.debounce_ns = debounce_ms * 1_000_000  # Convert to nanoseconds
+        self.last_trigger_ns = 0
         self.last_state = False  # False = not pressed, True = pressed
 
+        # Presses caught by the edge interrupt but not yet returned by check()
+        # The event is set while any are pending so callers can block on it
+        self._pending_presses = 0
+        self._pending_lock = threading.Lock()
+        self._press_event = threading.Event()
+
+        # Prefer the GPIO character device (libgpiod): the kernel debounces
+        # the line and queues its edges, so no Python-side debounce is needed
+        self._line_request = None
+        if gpiod is not None:
+            try:
+                self._line_request = gpiod.request_lines(
+                    GPIO_CHIP,
+                    consumer="limit-switch",
+                    config={self.pin: gpiod.LineSettings(
+                        direction=Direction.INPUT,
+                        edge_detection=Edge.FALLING,
+                        bias=Bias.PULL_UP,
+                        debounce_period=timedelta(milliseconds=debounce_ms))}
+                )
+                self.use_interrupts = True
+                self._start_event_thread()
+                print(
+                    f"Limit Switch: Initialized on {GPIO_CHIP} line {self.pin} with {debounce_ms}ms debounce")
+                return
+            except OSError as e:
+                print(f"Limit Switch: libgpiod unavailable ({e}), using RPi.GPIO")
+
         if GPIO is None:
             raise RuntimeError("RPi.GPIO module not available")
 
         # Setup GPIO pin with pull-up resistor
         # Assumes switch connects pin to ground when pressed
         GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+        # Catch presses with an edge interrupt so none are missed between
+        # polls; fall back to polling check() if edge detection is unavailable
+        try:
+            GPIO.add_event_detect(self.pin, GPIO.FALLING,
+                                  callback=self._on_edge, bouncetime=debounce_ms)
+            self.use_interrupts = True
+        except RuntimeError as e:
+            print(f"Limit Switch: Edge detection unavailable ({e}), polling instead")
+            self.use_interrupts = False
+
         print(
             f"Limit Switch: Initialized on GPIO {self.pin} with {debounce_ms}ms debounce")
 
+    def _on_press(self, channel):
+        """Edge interrupt callback - runs on the RPi.GPIO or libgpiod event thread"""
+        with self._pending_lock:
+            self._pending_presses += 1
+            self._press_event.set()
+
+    def _on_edge(self, channel):
+        """
+        RPi.GPIO falling-edge callback
+        bouncetime only drops edges close to the last one, so a release
+        bounce after a long press still arrives here - only count the edge
+        if the pin still reads pressed and the debounce time has passed
+        """
+        now_ns = time.monotonic_ns()
+        if not self.read_state():
+            return
+        if now_ns - self.last_trigger_ns < self.debounce_ns:
+            return
+        self.last_trigger_ns = now_ns
+        self._on_press(channel)
+
+    def _start_event_thread(self):
+        """Start a thread that turns queued libgpiod edge events into presses"""
+        self._events_running = True
+
+        def read_events():
+            while self._events_running:
+                if self._line_request.wait_edge_events(EVENT_WAIT_SECONDS):
+                    for _ in self._line_request.read_edge_events():
+                        self._on_press(self.pin)
+
+        self._event_thread = threading.Thread(target=read_events, daemon=True)
+        self._event_thread.start()
+
     def read_state(self):
         """
         Read the current state of the limit switch
@@ -47,7 +137,9 @@ class LimitSwitchSensor:
         Returns:
             bool: True if switch is pressed, False otherwise
         """
-        # GPIO.LOW means switch is pressed (pulls pin to ground)
+        # LOW means switch is pressed (pulls pin to ground)
+        if self._line_request is not None:
+            return self._line_request.get_value(self.pin) == Value.INACTIVE
         return GPIO.input(self.pin) == GPIO.LOW
 
     def check(self):
@@ -58,16 +150,68 @@ class LimitSwitchSensor:
         Returns:
             bool: True if a new press is detected, False otherwise
         """
-        current_time = time.time()
+        if not self.use_interrupts and self._poll_edge():
+            self._on_press(self.pin)
+
+        with self._pending_lock:
+            if self._pending_presses == 0:
+                # Also clears a wake() request
+                self._press_event.clear()
+                return False
+            self._pending_presses -= 1
+            if self._pending_presses == 0:
+                self._press_event.clear()
+
+        logger.debug("Limit Switch: PRESSED (GPIO %s)", self.pin)
+        return True
+
+    def wait_for_press(self, timeout):
+        """
+        Block until a press is pending or the timeout expires
+        Does not consume the press - call check() afterwards
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if a press is pending, False on timeout
+        """
+        if self.use_interrupts:
+            return self._press_event.wait(timeout)
+
+        # Polling fallback - sample the pin until the deadline
+        deadline = time.monotonic() + timeout
+        while not self._press_event.is_set():
+            if self._poll_edge():
+                self._on_press(self.pin)
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(FALLBACK_POLL_SECONDS, remaining))
+        return True
+
+    def wake(self):
+        """Release a blocked wait_for_press() early (e.g. on shutdown)"""
+        self._press_event.set()
+
+    def _poll_edge(self):
+        """
+        Sample the pin and detect a debounced press (polling fallback)
+
+        Returns:
+            bool: True if a new press is detected, False otherwise
+        """
+        # Monotonic clock - immune to wall-clock steps from NTP
+        now_ns = time.monotonic_ns()
         current_state = self.read_state()
 
         # Check for state change from not pressed to pressed
         if current_state and not self.last_state:
             # Check debounce
-            if current_time - self.last_trigger_time >= self.debounce_time:
-                self.last_trigger_time = current_time
+            if now_ns - self.last_trigger_ns >= self.debounce_ns:
+                self.last_trigger_ns = now_ns
                 self.last_state = current_state
-                print(f"Limit Switch: PRESSED (GPIO {self.pin})")
                 return True
 
         # Update state
@@ -78,5 +222,13 @@ class LimitSwitchSensor:
         """
         Cleanup GPIO resources
         """
+        if self._line_request is not None:
+            # Let the event thread finish its wait before releasing the line
+            self._events_running = False
+            self._event_thread.join()
+            self._line_request.release()
+            return
+
         # GPIO cleanup is typically handled globally
-        pass
+        if self.use_interrupts:
+            GPIO.remove_event_detect(self.pin)
@@ -4,8 +4,21 @@ Handles GPIO setup and debounced beam break detection
 """
 
 import RPi.GPIO as GPIO
+import threading
 import time
-from config import IR_PIN, DEBOUNCE_MS
+from config import IR_PIN, DEBOUNCE_MS, GPIO_CHIP
+
+try:
+    import gpiod
+    from gpiod.line import Bias, Direction, Edge, Value
+except ImportError:
+    gpiod = None
+
+# Poll interval used by wait_for_break() when edge detection is unavailable
+FALLBACK_POLL_SECONDS = 0.01
+
+# Longest single libgpiod wait in wait_for_break(), so wake() is noticed
+EVENT_WAIT_SECONDS = 0.1
 
 
 class IRSensor:
@@ -21,15 +34,100 @@ class IRSensor:
             pin: GPIO pin number (BCM numbering)
         """
         self.pin = pin
-        self.last_trigger_time = 0
-        self.debounce_time = DEBOUNCE_MS / 1000.0  # Convert to seconds
+        # Debounce on integer monotonic nanoseconds - shared by the polling
+        # fallback and libgpiod's kernel event timestamps (CLOCK_MONOTONIC)
+        self.debounce_ns = DEBOUNCE_MS * 1_000_000
+        self.last_event_ns = 0
         self.last_state = GPIO.HIGH
 
+        # Beam breaks caught by the edge interrupt but not yet returned by
+        # check(); the event is set while any are pending
+        self._pending_breaks = 0
+        self._pending_lock = threading.Lock()
+        self._break_event = threading.Event()
+
+        # Prefer the GPIO character device (libgpiod): the kernel queues
+        # timestamped edge events, so no pulse is lost between reads
+        self._line_request = None
+        if gpiod is not None:
+            try:
+                self._line_request = gpiod.request_lines(
+                    GPIO_CHIP,
+                    consumer="ir-sensor",
+                    config={self.pin: gpiod.LineSettings(
+                        direction=Direction.INPUT,
+                        edge_detection=Edge.FALLING,
+                        bias=Bias.PULL_UP)}
+                )
+                self.use_interrupts = True
+                print(f"IR Sensor initialized on {GPIO_CHIP} line {self.pin}")
+                return
+            except OSError as e:
+                print(f"IR Sensor: libgpiod unavailable ({e}), using RPi.GPIO")
+
         # Set up GPIO pin (assumes GPIO.setmode() already called)
         GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
+        # Let the kernel report falling edges instead of sampling the pin,
+        # falling back to polling if edge detection is unavailable
+        try:
+            GPIO.add_event_detect(self.pin, GPIO.FALLING,
+                                  callback=self._on_edge, bouncetime=DEBOUNCE_MS)
+            self.use_interrupts = True
+        except RuntimeError as e:
+            print(f"IR Sensor: Edge detection unavailable ({e}), polling instead")
+            self.use_interrupts = False
+
         print(f"IR Sensor initialized on GPIO {self.pin}")
 
+    def _on_break(self, channel):
+        """Edge interrupt callback - runs on the RPi.GPIO event thread"""
+        with self._pending_lock:
+            self._pending_breaks += 1
+            self._break_event.set()
+
+    def _on_edge(self, channel):
+        """
+        RPi.GPIO falling-edge callback
+        bouncetime only drops edges close to the last one, so a bounce when
+        the beam is restored can still arrive here - only count the edge if
+        the beam still reads broken and the debounce time has passed
+        """
+        now_ns = time.monotonic_ns()
+        if not self.read_state():
+            return
+        if now_ns - self.last_event_ns < self.debounce_ns:
+            return
+        self.last_event_ns = now_ns
+        self._on_break(channel)
+
+    def read_state(self):
+        """
+        Read the current state of the IR beam
+
+        Returns:
+            bool: True if the beam is broken, False otherwise
+        """
+        # LOW means the beam is interrupted
+        if self._line_request is not None:
+            return self._line_request.get_value(self.pin) == Value.INACTIVE
+        return GPIO.input(self.pin) == GPIO.LOW
+
+    def _read_line_events(self, timeout):
+        """
+        Read queued libgpiod edge events, debounced on kernel timestamps
+
+        Args:
+            timeout: Seconds to wait for the first event (0 to not block)
+        """
+        if not self._line_request.wait_edge_events(timeout):
+            return
+
+        for event in self._line_request.read_edge_events():
+            if event.timestamp_ns - self.last_event_ns >= self.debounce_ns:
+                self.last_event_ns = event.timestamp_ns
+                self._on_break(self.pin)
+
     def check(self):
         """
         Non-blocking check for IR beam break event
@@ -37,14 +135,80 @@ class IRSensor:
         Returns:
             bool: True if a new beam break event is detected, False otherwise
         """
-        current_time = time.monotonic()
+        if self._line_request is not None:
+            self._read_line_events(0)
+        elif not self.use_interrupts and self._poll_edge():
+            self._on_break(self.pin)
+
+        with self._pending_lock:
+            if self._pending_breaks == 0:
+                # Also clears a wake() request
+                self._break_event.clear()
+                return False
+            self._pending_breaks -= 1
+            if self._pending_breaks == 0:
+                self._break_event.clear()
+        return True
+
+    def wait_for_break(self, timeout):
+        """
+        Block until a beam break is pending or the timeout expires
+        Does not consume the event - call check() afterwards
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if a beam break is pending (or wake() was called),
+                False on timeout
+        """
+        if self._line_request is not None:
+            # Keep waiting if every event so far was dropped by the debounce
+            deadline = time.monotonic() + timeout
+            while not self._break_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._read_line_events(min(EVENT_WAIT_SECONDS, remaining))
+            return True
+
+        if self.use_interrupts:
+            return self._break_event.wait(timeout)
+
+        # Polling fallback - sample the pin until the deadline
+        deadline = time.monotonic() + timeout
+        while not self._break_event.is_set():
+            if self._poll_edge():
+                self._on_break(self.pin)
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(FALLBACK_POLL_SECONDS, remaining))
+        return True
+
+    # Same interface as LimitSwitchSensor, so DetectionService can use either
+    wait_for_press = wait_for_break
+
+    def wake(self):
+        """Release a blocked wait_for_break() early (e.g. on shutdown)"""
+        self._break_event.set()
+
+    def _poll_edge(self):
+        """
+        Sample the pin and detect a debounced beam break (polling fallback)
+
+        Returns:
+            bool: True if a new beam break is detected, False otherwise
+        """
+        now_ns = time.monotonic_ns()
         current_state = GPIO.input(self.pin)
 
         # Detect falling edge (beam interrupted: HIGH -> LOW)
         if self.last_state == GPIO.HIGH and current_state == GPIO.LOW:
             # Check debounce timing
-            if (current_time - self.last_trigger_time) >= self.debounce_time:
-                self.last_trigger_time = current_time
+            if now_ns - self.last_event_ns >= self.debounce_ns:
+                self.last_event_ns = now_ns
                 self.last_state = current_state
                 return True
 
@@ -55,4 +219,10 @@ class IRSensor:
         """
         Clean up GPIO resources
         """
+        if self._line_request is not None:
+            self._line_request.release()
+            return
+
+        if self.use_interrupts:
+            GPIO.remove_event_detect(self.pin)
         GPIO.cleanup(self.pin)
@@ -7,16 +7,40 @@ Raspberry Pi 4 compatible
 
 import spidev
 import RPi.GPIO as GPIO
+import queue
 import time
-from PIL import Image
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 import threading
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Bytes handed to spidev per writebytes2() call when pushing a frame, used
+# when the kernel's spidev transfer size cannot be read
+SPI_CHUNK_SIZE = 32768
+
+# Kernel limit for a single spidev transfer (set with spidev.bufsiz=...)
+SPIDEV_BUFSIZ_PATH = "/sys/module/spidev/parameters/bufsiz"
+
+# Converted pixel buffers that may wait for the SPI writer thread
+WRITE_QUEUE_DEPTH = 2
+
+# Per-channel lookup tables for BGR565 without NumPy - each gives a channel's
+# bits already shifted into the high (BBBBBGGG) or low (GGGRRRRR) byte
+_BLUE_HIGH = [v & 0xF8 for v in range(256)]
+_GREEN_HIGH = [v >> 5 for v in range(256)]
+_GREEN_LOW = [(v & 0x1C) << 3 for v in range(256)]
+_RED_LOW = [v >> 3 for v in range(256)]
+
 
 class ST7789:
     """Driver for ST7789 TFT display"""
 
     def __init__(self, spi_bus=0, spi_device=0, dc_pin=9, rst_pin=25, bl_pin=None,
-                 width=240, height=320, rotation=0):
+                 width=240, height=320, rotation=0, spi_speed_hz=62500000):
         """
         Initialize ST7789 display
 
@@ -29,6 +53,8 @@ class ST7789:
             width: Display width in pixels
             height: Display height in pixels
             rotation: Display rotation in degrees (0, 90, 180, 270)
+            spi_speed_hz: SPI clock (62.5 MHz is the ST7789 write limit and an
+                exact divider of the Pi 4 core clock; lower it for long wires)
         """
         self.base_width = width
         self.base_height = height
@@ -60,12 +86,49 @@ class ST7789:
         # Setup SPI
         self.spi = spidev.SpiDev()
         self.spi.open(spi_bus, spi_device)
-        self.spi.max_speed_hz = 40000000  # 40 MHz
+        self.spi.max_speed_hz = spi_speed_hz
         self.spi.mode = 0
+        self.spi_chunk_size = self._read_spi_bufsiz()
 
         # Initialize display
         self._init_display()
 
+        # Scratch arrays for the NumPy BGR565 conversion, sized for a full
+        # frame and reused (as views) for every image or region, and
+        # full-frame output buffers used in turn for the converted pixels.
+        # An output buffer is only reused once the queue (WRITE_QUEUE_DEPTH)
+        # and the writer (one in flight) have moved past it
+        if np is not None:
+            pixels = self.width * self.height
+            self._bgr565 = np.empty(pixels, dtype=np.uint16)
+            self._bgr565_tmp = np.empty(pixels, dtype=np.uint16)
+            self._out_buffers = [bytearray(pixels * 2)
+                                 for _ in range(WRITE_QUEUE_DEPTH + 2)]
+            self._out_index = 0
+
+        # Pixel writes go through a writer thread so the next buffer can be
+        # converted while the current one is on the bus (double buffering)
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+        self._start_writer_thread()
+
+        # Solid full-screen frames built by fill(), keyed by BGR565 color
+        self._fill_frames = {}
+
+    @staticmethod
+    def _read_spi_bufsiz():
+        """
+        Read the kernel's spidev transfer size, so each writebytes2() call
+        is exactly one SPI transfer
+
+        Returns:
+            int: Bytes per transfer, SPI_CHUNK_SIZE if it cannot be read
+        """
+        try:
+            with open(SPIDEV_BUFSIZ_PATH) as f:
+                return int(f.read()) or SPI_CHUNK_SIZE
+        except (OSError, ValueError):
+            return SPI_CHUNK_SIZE
+
     def _init_display(self):
         """Initialize the ST7789 display"""
         self._reset()
@@ -99,16 +162,12 @@ class ST7789:
         self._send_data(rotation_values.get(self.rotation, 0x00) | 0x08)
 
         self._send_command(0x2A)  # Column address set
-        self._send_data(0x00)
-        self._send_data(0x00)
-        self._send_data((self.base_width - 1) >> 8)
-        self._send_data((self.base_width - 1) & 0xFF)
+        self._send_data([0x00, 0x00,
+                         (self.base_width - 1) >> 8, (self.base_width - 1) & 0xFF])
 
         self._send_command(0x2B)  # Row address set
-        self._send_data(0x00)
-        self._send_data(0x00)
-        self._send_data((self.base_height - 1) >> 8)
-        self._send_data((self.base_height - 1) & 0xFF)
+        self._send_data([0x00, 0x00,
+                         (self.base_height - 1) >> 8, (self.base_height - 1) & 0xFF])
 
         self._send_command(0x21)  # Inversion on
 
@@ -137,56 +196,153 @@ class ST7789:
         if isinstance(data, int):
             self.spi.writebytes([data])
         else:
-            self.spi.writebytes(data)
+            self.spi.writebytes2(data)
 
     def display_image(self, image):
-        """Display a PIL Image on the screen"""
-        # Resize image if needed
-        if image.size != (self.width, self.height):
-            image = image.resize((self.width, self.height))
+        """
+        Display a PIL Image on the screen
+
+        Args:
+            image: PIL Image of exactly (width, height) - callers draw at the
+                display size, so no resize is done here
+        """
+        assert image.size == (self.width, self.height), image.size
 
+        self.display_region(image, 0, 0)
+
+    def display_region(self, image, x, y):
+        """
+        Display a PIL Image in a rectangle of the screen
+        Only the image's pixels are sent, so small updates cost little SPI time
+
+        Args:
+            image: PIL Image that fits on screen at (x, y)
+            x: Left column of the rectangle
+            y: Top row of the rectangle
+        """
+        buffer = self._to_bgr565(image)
+
+        width, height = image.size
+        self._queue_write(x, y, x + width - 1, y + height - 1, buffer)
+
+    def _start_writer_thread(self):
+        """Start the thread that performs all SPI pixel writes"""
+        def write_loop():
+            while True:
+                window, buffer = self._write_queue.get()
+                try:
+                    # Set drawing window
+                    self._set_window(*window)
+
+                    # Send image data one kernel transfer at a time -
+                    # writebytes2 reads the memoryview slices in place
+                    GPIO.output(self.dc_pin, GPIO.HIGH)
+                    view = memoryview(buffer)
+                    chunk = self.spi_chunk_size
+                    for i in range(0, len(view), chunk):
+                        self.spi.writebytes2(view[i:i + chunk])
+                except Exception as e:
+                    print(f"SPI write error: {e}")
+                finally:
+                    self._write_queue.task_done()
+
+        threading.Thread(target=write_loop, daemon=True).start()
+
+    def _queue_write(self, x0, y0, x1, y1, buffer):
+        """Queue pixel data for a window, blocking while the queue is full"""
+        self._write_queue.put(((x0, y0, x1, y1), buffer))
+
+    def flush(self):
+        """Wait until every queued pixel write has reached the display"""
+        self._write_queue.join()
+
+    def _to_bgr565(self, image):
+        """
+        Convert a PIL Image to the display's BGR565 byte stream
+
+        Returns:
+            Buffer of pixel bytes (a memoryview into the next preallocated
+            output buffer when NumPy is available)
+        """
         # Convert to RGB565
         rgb_image = image.convert('RGB')
-        pixels = list(rgb_image.getdata())
 
         # Convert RGB888 to BGR565 (ST7789 uses BGR byte order)
         # High byte: BBBBBGGG, Low byte: GGGRRRRR
-        buffer = []
-        for r, g, b in pixels:
-            bgr565 = ((b & 0xF8) << 8) | ((g & 0xFC) << 3) | (r >> 3)
-            # contains blue + upper green bits
-            high_byte = (bgr565 >> 8) & 0xFF
-            low_byte = bgr565 & 0xFF           # contains lower green + red bits
-            buffer.append(high_byte)
-            buffer.append(low_byte)
-
-        # Set drawing window
+        if np is not None:
+            data = rgb_image.tobytes()
+            buffer = self._out_buffers[self._out_index]
+            self._out_index = (self._out_index + 1) % len(self._out_buffers)
+            size = len(data) // 3 * 2
+
+            # Whole image at once, computed in the preallocated scratch
+            # arrays and packed as big-endian 16-bit words
+            width, height = rgb_image.size
+            count = width * height
+            arr = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+            out = self._bgr565[:count].reshape(height, width)
+            tmp = self._bgr565_tmp[:count].reshape(height, width)
+
+            np.bitwise_and(arr[..., 2], 0xF8, out=out, casting='unsafe')
+            np.left_shift(out, 8, out=out)
+            np.bitwise_and(arr[..., 1], 0xFC, out=tmp, casting='unsafe')
+            np.left_shift(tmp, 3, out=tmp)
+            np.bitwise_or(out, tmp, out=out)
+            np.right_shift(arr[..., 0], 3, out=tmp, casting='unsafe')
+            np.bitwise_or(out, tmp, out=out)
+
+            # Pack as big-endian 16-bit words straight into the output buffer
+            packed = np.frombuffer(buffer, dtype='>u2', count=count)
+            packed.reshape(height, width)[...] = out
+            return memoryview(buffer)[:size]
+
+        # Without NumPy, let Pillow do the bit packing in C: map each channel
+        # through a lookup table, add the disjoint bit fields of each byte,
+        # and interleave the two bytes as a two-band image
+        red, green, blue = rgb_image.split()
+        high = ImageChops.add(blue.point(_BLUE_HIGH), green.point(_GREEN_HIGH))
+        low = ImageChops.add(green.point(_GREEN_LOW), red.point(_RED_LOW))
+        return Image.merge('LA', (high, low)).tobytes()
+
+    def _set_window(self, x0, y0, x1, y1):
+        """Set the drawing window and start a memory write"""
+        # Each command's 4 argument bytes go out in one SPI transfer
         self._send_command(0x2A)  # Column address set
-        self._send_data(0x00)
-        self._send_data(0x00)
-        self._send_data((self.width - 1) >> 8)
-        self._send_data((self.width - 1) & 0xFF)
+        self._send_data([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
 
         self._send_command(0x2B)  # Row address set
-        self._send_data(0x00)
-        self._send_data(0x00)
-        self._send_data((self.height - 1) >> 8)
-        self._send_data((self.height - 1) & 0xFF)
+        self._send_data([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
 
         self._send_command(0x2C)  # Memory write
 
-        # Send image data in chunks
-        chunk_size = 4096
-        for i in range(0, len(buffer), chunk_size):
-            self._send_data(buffer[i:i + chunk_size])
+    def fill(self, color=(0, 0, 0)):
+        """
+        Fill the whole screen with a single color
+
+        The frame is built with one bytes multiply instead of drawing and
+        converting a PIL image, and kept for later fills of the same color
+        (it is immutable, so it can be queued again safely).
+
+        Args:
+            color: (r, g, b) tuple
+        """
+        r, g, b = color
+        bgr565 = ((b & 0xF8) << 8) | ((g & 0xFC) << 3) | (r >> 3)
+        frame = self._fill_frames.get(bgr565)
+        if frame is None:
+            frame = bytes((bgr565 >> 8, bgr565 & 0xFF)) * \
+                (self.width * self.height)
+            self._fill_frames[bgr565] = frame
+
+        self._queue_write(0, 0, self.width - 1, self.height - 1, frame)
 
     def clear(self, color=(0, 0, 0)):
         """Clear display with specified color"""
-        image = Image.new('RGB', (self.width, self.height), color)
-        self.display_image(image)
+        self.fill(color)
 
     def cleanup(self):
         """Cleanup GPIO and SPI"""
+        self.flush()
         try:
             if self.bl_pin is not None:
                 GPIO.output(self.bl_pin, GPIO.LOW)
@@ -229,21 +385,132 @@ class TFT:
             print(f"Failed to initialize TFT display: {e}")
             self.display = None
 
+        # Fonts are parsed once here rather than on every frame
+        self._load_fonts()
+
+        # Rasterized glyphs keyed by (font, character):
+        # (mask, advance, x offset, y offset)
+        self._glyphs = {}
+
         self.current_time = ""
         self._start_time_thread()
 
+        # Values of the last frame handed to the render thread
+        self._last_key = None
+
+        # Last frame pushed to the panel, diffed to find what changed, and
+        # the frame the next render is drawn into - the two are swapped
+        # after every render instead of allocating a new image
+        self._frame = None
+        self._back = None
+
+        # Static background and dirty-check tiles, set up on the first render
+        self._chrome = None
+        self._tiles = None
+
+        # Latest values waiting to be drawn by the render thread
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        self._render_event = threading.Event()
+        self._start_render_thread()
+
+    def _load_fonts(self):
+        """Load the frame fonts, falling back to the PIL default font"""
+        try:
+            self.font_large = ImageFont.truetype(
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 40)
+            self.font_medium = ImageFont.truetype(
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
+            self.font_small = ImageFont.truetype(
+                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
+        except:
+            self.font_large = ImageFont.load_default()
+            self.font_medium = ImageFont.load_default()
+            self.font_small = ImageFont.load_default()
+
+    def _glyph(self, font, char):
+        """
+        Get the rasterized mask of a single character, rendering it once
+
+        Args:
+            font: PIL font the character is drawn with
+            char: Character to render
+
+        Returns:
+            tuple: (mask image, horizontal advance in pixels, x offset,
+                y offset) - the offsets are where the draw origin sits in
+                the mask, non-zero when the glyph extends left of or above it
+        """
+        glyph = self._glyphs.get((font, char))
+        if glyph is None:
+            left, top, right, bottom = font.getbbox(char)
+            advance = int(round(font.getlength(char)))
+            x_offset = -min(left, 0)
+            y_offset = -min(top, 0)
+            mask = Image.new('L', (max(right, advance, 1) + x_offset,
+                                   max(bottom, 1) + y_offset), 0)
+            ImageDraw.Draw(mask).text(
+                (x_offset, y_offset), char, fill=255, font=font)
+            glyph = (mask, advance, x_offset, y_offset)
+            self._glyphs[(font, char)] = glyph
+        return glyph
+
+    def _draw_text(self, img, xy, text, fill, font):
+        """
+        Draw text from cached glyphs instead of re-rasterizing it every
+        frame (the drawn values are short strings of digits)
+        Characters are placed by their own advance, so kerning pairs are
+        not applied - fine for the digits and labels drawn here, but text
+        with kerned pairs (e.g. "AV") comes out slightly wider than with
+        ImageDraw.text
+
+        Args:
+            img: PIL Image to draw on
+            xy: (x, y) position, as for ImageDraw.text
+            text: Text to draw
+            fill: RGB text color
+            font: PIL font to draw with
+        """
+        x, y = xy
+        for char in text:
+            mask, advance, x_offset, y_offset = self._glyph(font, char)
+            left = x - x_offset
+            top = y - y_offset
+            img.paste(fill, (left, top, left + mask.width, top + mask.height), mask)
+            x += advance
+
     def _start_time_thread(self):
         """Start a thread to update the time periodically."""
         def update_time():
             while True:
                 self.current_time = time.strftime("%H:%M")
-                time.sleep(60)  # Update every minute
+                # Sleep until the next minute boundary
+                time.sleep(60 - time.time() % 60)
 
         threading.Thread(target=update_time, daemon=True).start()
 
+    def _start_render_thread(self):
+        """Start a thread that draws the most recently requested frame."""
+        def render_loop():
+            while True:
+                self._render_event.wait()
+                self._render_event.clear()
+
+                with self._pending_lock:
+                    values = self._pending
+                    self._pending = None
+
+                if values is not None:
+                    self._render(*values)
+
+        threading.Thread(target=render_loop, daemon=True).start()
+
     def show(self, total, soil, water, distance=None):
         """
         Display battery counter statistics on the TFT
+        Returns immediately - the frame is drawn on the render thread, and
+        a newer call replaces any frame that has not been drawn yet.
+        Calls that would redraw an identical frame are skipped
 
         Args:
             total: Total battery count
@@ -254,89 +521,135 @@ class TFT:
         if self.display is None:
             return
 
-        try:
-            from PIL import Image, ImageDraw, ImageFont
-
-            # Create image
-            img = Image.new('RGB', (self.display.width,
-                            self.display.height), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
-
-            # Try to use a default font, fallback to basic if not available
-            try:
-                font_large = ImageFont.truetype(
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 40)
-                font_medium = ImageFont.truetype(
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-                font_small = ImageFont.truetype(
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
-            except:
-                font_large = ImageFont.load_default()
-                font_medium = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-
-            # Draw title
-            draw.text((10, 10), "Battery Counter", fill=(
-                255, 255, 255), font=font_medium)
-
-            # Draw separator line
-            draw.line([(10, 45), (310, 45)], fill=(100, 100, 100), width=2)
+        # Skip the frame if nothing visible has changed since the last one
+        key = (total, soil, water,
+               distance if self.show_distance else None, self.current_time)
+        if key == self._last_key:
+            return
+        self._last_key = key
 
-            # Draw total count
-            draw.text((10, 60), "Total Batteries:", fill=(
-                100, 200, 255), font=font_medium)
-            draw.text((10, 90), f"{int(total)}", fill=(
-                255, 255, 255), font=font_large)
+        with self._pending_lock:
+            self._pending = (total, soil, water, distance)
+        self._render_event.set()
 
-            # Adjust battery position to move it to the left
-            battery_x = 250  # Reduced x-coordinate to shift left
-            battery_y = 60
-            battery_width = 30
-            battery_height = 60
-
-            # Battery terminal (positive) at top - PURPLE
-            terminal_width = 14
-            terminal_height = 5
-            draw.rectangle(
-                [(battery_x + (battery_width - terminal_width) // 2, battery_y - terminal_height),
-                 (battery_x + (battery_width + terminal_width) // 2, battery_y)],
-                fill=(128, 0, 128)  # Purple
-            )
+    def _build_chrome(self):
+        """
+        Draw the parts of the frame that never change (title, labels,
+        separators and battery icon)
 
-            # Battery body with dark purple outline - PURPLE
-            draw.rectangle(
-                [(battery_x, battery_y), (battery_x +
-                                          battery_width, battery_y + battery_height)],
-                outline=(128, 0, 128), fill=None, width=3  # Purple
-            )
+        Returns:
+            PIL Image used as the background of every frame
+        """
+        img = Image.new('RGB', (self.display.width,
+                        self.display.height), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        font_medium = self.font_medium
+        font_small = self.font_small
+
+        # Draw title
+        draw.text((10, 10), "Battery Counter", fill=(
+            255, 255, 255), font=font_medium)
+
+        # Draw separator line
+        draw.line([(10, 45), (310, 45)], fill=(100, 100, 100), width=2)
+
+        # Draw total count label
+        draw.text((10, 60), "Total Batteries:", fill=(
+            100, 200, 255), font=font_medium)
+
+        # Adjust battery position to move it to the left
+        battery_x = 250  # Reduced x-coordinate to shift left
+        battery_y = 60
+        battery_width = 30
+        battery_height = 60
+
+        # Battery terminal (positive) at top - PURPLE
+        terminal_width = 14
+        terminal_height = 5
+        draw.rectangle(
+            [(battery_x + (battery_width - terminal_width) // 2, battery_y - terminal_height),
+             (battery_x + (battery_width + terminal_width) // 2, battery_y)],
+            fill=(128, 0, 128)  # Purple
+        )
+
+        # Battery body with dark purple outline - PURPLE
+        draw.rectangle(
+            [(battery_x, battery_y), (battery_x +
+                                      battery_width, battery_y + battery_height)],
+            outline=(128, 0, 128), fill=None, width=3  # Purple
+        )
+
+        # Battery fill (lighter purple inside) - PURPLE
+        fill_height = int(battery_height * 0.75)
+        draw.rectangle(
+            [(battery_x + 3, battery_y + battery_height - fill_height - 3),
+             (battery_x + battery_width - 3, battery_y + battery_height - 3)],
+            fill=(186, 85, 211)  # Light Purple
+        )
+
+        # Draw separator
+        draw.line([(10, 140), (310, 140)], fill=(100, 100, 100), width=1)
+
+        # Draw soil and water labels
+        draw.text((10, 155), "Soil Saved:", fill=(
+            100, 150, 255), font=font_small)
+        draw.text((160, 155), "Water Saved:", fill=(
+            255, 150, 100), font=font_small)
+
+        return img
+
+    def _build_tiles(self):
+        """
+        Split the frame into tiles that each hold one changing value
+        (clock, total, soil, water, distance). The tiles cover the whole
+        frame, so any change is caught even if text overflows its tile
 
-            # Battery fill (lighter purple inside) - PURPLE
-            fill_height = int(battery_height * 0.75)
-            draw.rectangle(
-                [(battery_x + 3, battery_y + battery_height - fill_height - 3),
-                 (battery_x + battery_width - 3, battery_y + battery_height - 3)],
-                fill=(186, 85, 211)  # Light Purple
-            )
+        Returns:
+            list: (x0, y0, x1, y1) boxes
+        """
+        width = self.display.width
+        height = self.display.height
+        return [
+            (0, 0, width, 50),        # Title and clock
+            (0, 50, width, 145),      # Total count
+            (0, 145, 160, 210),       # Soil saved
+            (160, 145, width, 210),   # Water saved
+            (0, 210, width, height),  # Distance
+        ]
+
+    def _render(self, total, soil, water, distance):
+        """Draw one frame of statistics and push it to the display"""
+        try:
+            # Start from the static chrome - only the values are drawn here
+            if self._chrome is None:
+                self._chrome = self._build_chrome()
+                self._tiles = self._build_tiles()
+                self._back = self._chrome.copy()
+            img = self._back
+            img.paste(self._chrome)
+            draw_text = self._draw_text
+
+            font_large = self.font_large
+            font_medium = self.font_medium
+            font_small = self.font_small
 
-            # Draw separator
-            draw.line([(10, 140), (310, 140)], fill=(100, 100, 100), width=1)
+            # Draw total count
+            draw_text(img, (10, 90), f"{int(total)}", fill=(
+                255, 255, 255), font=font_large)
 
             # Draw soil pollution
-            draw.text((10, 155), "Soil Saved:", fill=(
-                100, 150, 255), font=font_small)
-            draw.text((10, 180), f"{soil} m3", fill=(
+            draw_text(img, (10, 180), f"{soil} m3", fill=(
                 150, 200, 255), font=font_medium)
 
             # Draw water pollution
-            draw.text((160, 155), "Water Saved:", fill=(
-                255, 150, 100), font=font_small)
-            draw.text((160, 180), f"{water} L", fill=(
+            draw_text(img, (160, 180), f"{water} L", fill=(
                 255, 200, 150), font=font_medium)
 
             # Center the clock horizontally in the top-right section
             clock_x = self.display.width - 60  # Adjusted x-coordinate for centering
             clock_y = 15  # Vertically center the clock in the top-right section
-            draw.text((clock_x, clock_y), self.current_time,
+            draw_text(img, (clock_x, clock_y), self.current_time,
                       fill=(255, 255, 255), font=font_small)
 
             # Draw TOF sensor distance reading at bottom (if enabled)
@@ -344,14 +657,34 @@ class TFT:
                 distance_text = f"Distance: {distance}mm"
                 if distance < 0:
                     distance_text = "Distance: ERROR"
-                draw.text((10, 215), distance_text, fill=(
+                draw_text(img, (10, 215), distance_text, fill=(
                     100, 255, 100), font=font_small)
 
-            # Display the image
-            self.display.display_image(img)
+            # Only push what differs from the previous frame, one rectangle
+            # per tile so two distant values don't drag in everything between
+            if self._frame is None:
+                self.display.display_image(img)
+            else:
+                diff = ImageChops.difference(img, self._frame)
+                for x0, y0, x1, y1 in self._tiles:
+                    bbox = diff.crop((x0, y0, x1, y1)).getbbox()
+                    if bbox is None:
+                        continue
+                    box = (x0 + bbox[0], y0 + bbox[1],
+                           x0 + bbox[2], y0 + bbox[3])
+                    self.display.display_region(img.crop(box), box[0], box[1])
+
+            # Pixels are converted before display_*() returns, so the old
+            # frame can be drawn over next time
+            self._back = self._frame if self._frame is not None else img.copy()
+            self._frame = img
 
         except Exception as e:
             print(f"Error updating display: {e}")
+            # The frame may not have reached the panel - let the next show()
+            # with the same values through, and redraw it in full
+            self._last_key = None
+            self._frame = None
 
     def cleanup(self):
         """
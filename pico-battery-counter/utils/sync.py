@@ -3,61 +3,250 @@ Sync Module for Cache Management and Cloud API Integration
 Handles local caching, internet connectivity, and background syncing
 """
 
+import atexit
 import json
+import logging
+import os
+import queue
 import time
 import requests
-import subprocess
+import socket
 import threading
 from pathlib import Path
+from urllib3.util.retry import Retry
 from config import (
-    API_LOG, API_STATS, DEVICE_ID, CACHE_FILE,
-    WIFI_CHECK_HOST, SYNC_INTERVAL_SECONDS
+    API_LOG, API_LOG_BATCH, API_STATS, DEVICE_ID, CACHE_FILE,
+    LEGACY_CACHE_FILE, REJECTED_CACHE_FILE,
+    WIFI_CHECK_HOST, WIFI_CHECK_PORT, SYNC_INTERVAL_SECONDS, SYNC_BATCH_SIZE,
+    SYNC_MAX_INTERVAL_SECONDS
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 # Thread-safe cache access lock
 _cache_lock = threading.Lock()
 
+# Records waiting to be appended to the cache file by the writer thread
+RECORD_QUEUE_SIZE = 1024
+# How long shutdown waits for the writer thread before writing inline
+RECORD_FLUSH_TIMEOUT_SECONDS = 2
+_record_queue = queue.Queue(maxsize=RECORD_QUEUE_SIZE)
+_writer_thread = None
+
+# Number of records in the cache file - tracked on every load/save/append so
+# the count can be read without re-parsing the file (None until first access)
+_unsynced_count = None
+
+# JSON Helpers
+
+
+def _dumps(obj):
+    """Serialize to a compact JSON string (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _loads(text):
+    """Parse a JSON string (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 # Cache Management Functions
+#
+# The cache is an append-only JSON Lines file (one record per line), so
+# recording a detection is a single small append instead of re-reading and
+# rewriting every cached record. It is only rewritten after a sync.
+
+
+def _read_cache_file():
+    """Read all records from the cache file (caller holds _cache_lock)"""
+    global _unsynced_count
+
+    cache_path = Path(CACHE_FILE)
+    if not cache_path.exists():
+        _unsynced_count = 0
+        return []
+
+    data = []
+    try:
+        with open(cache_path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    data.append(_loads(line))
+                except ValueError as e:
+                    # Skip a line torn by a power cut, keep the rest
+                    print(f"Skipping corrupt cache line: {e}")
+    except IOError as e:
+        print(f"Error loading cache: {e}")
+
+    _unsynced_count = len(data)
+    return data
+
+
+def _write_cache_file(data):
+    """
+    Replace the cache file contents (caller holds _cache_lock)
+    Written to a temporary file that is renamed over the cache, so a power
+    cut leaves either the old or the new contents, never a truncated file
+    """
+    global _unsynced_count
+
+    tmp_path = CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.writelines(_dumps(record) + "\n" for record in data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CACHE_FILE)
+        _unsynced_count = len(data)
+    except IOError as e:
+        print(f"Error saving cache: {e}")
 
 
 def load_cache():
     """
-    Load cached records from JSON file
+    Load cached records from the JSON Lines cache file
 
     Returns:
         list: List of cached records, empty list if file doesn't exist
     """
     with _cache_lock:
-        cache_path = Path(CACHE_FILE)
-        if not cache_path.exists():
-            return []
-
-        try:
-            with open(cache_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading cache: {e}")
-            return []
+        return _read_cache_file()
 
 
 def save_cache(data):
     """
-    Save records to cache file
+    Save records to cache file, replacing its contents
 
     Args:
         data: List of records to save
     """
+    with _cache_lock:
+        _write_cache_file(data)
+
+
+def remove_synced_records(count):
+    """
+    Drop the oldest records from the cache after they have been uploaded
+    Records are only ever appended, so the synced ones are always at the
+    front; records added while the upload was in flight are kept
+
+    Args:
+        count: Number of records that were synced
+    """
+    with _cache_lock:
+        _write_cache_file(_read_cache_file()[count:])
+
+
+def prepare_cache():
+    """
+    Get the cache file ready before the services start:
+    terminate a line left unfinished by a power cut, so the next append
+    starts on its own line, and move records from the old JSON array
+    cache file into the JSON Lines cache
+    """
+    cache_path = Path(CACHE_FILE)
+    try:
+        with _cache_lock:
+            if cache_path.exists() and cache_path.stat().st_size > 0:
+                with open(cache_path, 'rb+') as f:
+                    f.seek(-1, 2)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+    except IOError as e:
+        print(f"Error checking cache: {e}")
+
+    legacy_path = Path(LEGACY_CACHE_FILE)
+    if not legacy_path.exists():
+        return
+
+    try:
+        with open(legacy_path, 'r') as f:
+            records = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error reading legacy cache: {e}")
+        return
+
+    save_cache(load_cache() + records)
+    legacy_path.unlink()
+    print(f"Migrated {len(records)} records from {LEGACY_CACHE_FILE}")
+
+
+def get_unsynced_count():
+    """
+    Get the number of cached records waiting to be synced
+    Only reads the cache file on first use
+
+    Returns:
+        int: Number of unsynced records
+    """
+    if _unsynced_count is None:
+        load_cache()
+    return _unsynced_count
+
+
+def _append_records(records):
+    """
+    Append records to the cache file in a single write
+
+    Args:
+        records: List of records to append
+
+    Returns:
+        bool: True if the records were written, False on error
+    """
+    global _unsynced_count
+
     with _cache_lock:
         try:
-            with open(CACHE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(CACHE_FILE, 'a') as f:
+                f.write("".join(_dumps(record) + "\n" for record in records))
+            if _unsynced_count is not None:
+                _unsynced_count += len(records)
         except IOError as e:
             print(f"Error saving cache: {e}")
+            return False
+    return True
+
+
+def _cache_writer():
+    """
+    Background worker that appends queued records to the cache file,
+    coalescing records that arrive together into one write
+    """
+    while True:
+        records = [_record_queue.get()]
+        while True:
+            try:
+                records.append(_record_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            _append_records(records)
+        except Exception as e:
+            # Keep the writer alive so shutdown doesn't wait on it forever
+            print(f"Cache writer error: {e}")
+        finally:
+            for _ in records:
+                _record_queue.task_done()
 
 
 def add_record():
     """
     Add a new battery count record to the cache
+    Returns without touching the disk - the record is written by the
+    cache writer thread
     """
     record = {
         "timestamp": int(time.time()),
@@ -65,53 +254,92 @@ def add_record():
         "device": DEVICE_ID
     }
 
-    cache = load_cache()
-    cache.append(record)
-    save_cache(cache)
-    print(f"Record added to cache: {record}")
+    try:
+        _record_queue.put_nowait(record)
+    except queue.Full:
+        # Writer has fallen far behind - write inline rather than lose a count
+        print("Record queue full, writing to cache directly")
+        if not _append_records([record]):
+            return
+
+    # Runs on the detection thread - debug only, and formatted lazily
+    logger.debug("Record added to cache: %s", record)
 
 
 # Network Functions
 
+# Shared HTTP session - keeps the TLS connection to the API alive between
+# sync cycles instead of doing a fresh handshake for every request.
+# Only the sync thread uses it.
+_session = requests.Session()
+_session.headers['Accept'] = 'application/json'
+# One keep-alive connection is all a single sync thread needs. A couple of
+# quick retries cover failed connects and the stats GET hitting a socket
+# the server has dropped while idle. Batch POSTs are not retried after they
+# have been sent (urllib3 only retries idempotent methods on read errors),
+# since a repeated batch could be counted twice - a failed batch stays
+# cached and is re-sent on the next sync cycle
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=1, pool_maxsize=1,
+    max_retries=Retry(total=2, backoff_factor=0.2))
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+atexit.register(_session.close)
+
+# Request bodies are serialized with _dumps() rather than requests' json=
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
 def has_internet():
     """
-    Check if internet connection is available via ping
+    Check if internet connection is available via a TCP connect
+    (no ping process is spawned)
 
     Returns:
         bool: True if internet is available, False otherwise
     """
     try:
-        result = subprocess.run(
-            ['ping', '-c', '1', '-W', '1', WIFI_CHECK_HOST],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=2
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, Exception) as e:
+        socket.create_connection(
+            (WIFI_CHECK_HOST, WIFI_CHECK_PORT), timeout=1).close()
+        return True
+    except OSError:
         return False
 
 
+# Last stats response and its ETag - the API answers a matching
+# If-None-Match with an empty 304, so unchanged stats aren't re-sent/parsed
+_stats_etag = None
+_stats_cached = None
+
+
 def fetch_stats():
     """
     Fetch statistics from the cloud API
+    Callers check has_internet() first
 
     Returns:
         dict: Statistics with keys 'total', 'soil', 'water', or None if failed
     """
-    if not has_internet():
-        return None
+    global _stats_etag, _stats_cached
 
     try:
-        response = requests.get(API_STATS, timeout=5)
+        headers = None
+        if _stats_etag is not None and _stats_cached is not None:
+            headers = {'If-None-Match': _stats_etag}
+
+        response = _session.get(API_STATS, headers=headers, timeout=5)
+        if response.status_code == 304 and _stats_cached is not None:
+            return _stats_cached
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             # Ensure required keys exist
-            return {
+            _stats_cached = {
                 "total": data.get("total", 0),
                 "soil": data.get("soil", 0),
                 "water": data.get("water", 0)
             }
+            _stats_etag = response.headers.get('ETag')
+            return _stats_cached
     except (requests.RequestException, json.JSONDecodeError, Exception) as e:
         print(f"Error fetching stats: {e}")
 
@@ -143,6 +371,129 @@ def get_latest_stats():
         return _latest_stats.copy()
 
 
+# Cleared when the API answers 404 for the batch endpoint (an older API),
+# after which records are uploaded one at a time until restart
+_batch_supported = True
+
+
+def _quarantine_records(records):
+    """
+    Move records the API rejected out of the sync path, so one bad record
+    can't block the ones behind it; they are kept for inspection
+
+    Args:
+        records: List of rejected records
+    """
+    try:
+        with open(REJECTED_CACHE_FILE, 'a') as f:
+            f.write("".join(_dumps(record) + "\n" for record in records))
+        print(f"Moved {len(records)} rejected records to {REJECTED_CACHE_FILE}")
+    except IOError as e:
+        print(f"Error saving rejected records: {e}")
+
+
+def _upload_one_by_one(records):
+    """
+    POST records to the single-record endpoint, in order
+    A 400 rejects just that record (it is quarantined); any other failure
+    stops the upload so the rest are retried next cycle
+
+    Args:
+        records: List of records to upload
+
+    Returns:
+        int: Number of leading records handled (uploaded or rejected)
+    """
+    handled = 0
+    rejected = []
+
+    for record in records:
+        try:
+            response = _session.post(
+                API_LOG,
+                data=_dumps(record).encode(),
+                headers=_JSON_HEADERS,
+                timeout=10
+            )
+        except requests.RequestException as e:
+            print(f"Error syncing record: {e}")
+            break
+
+        if response.status_code == 400:
+            print(f"Record rejected by server: {record}")
+            rejected.append(record)
+        elif response.status_code != 200:
+            print(f"Failed to sync record (status {response.status_code})")
+            break
+
+        handled += 1
+
+    if rejected:
+        _quarantine_records(rejected)
+    if handled > len(rejected):
+        print(f"Synced {handled - len(rejected)} records")
+    return handled
+
+
+def _upload_records(records):
+    """
+    Upload cached records oldest first, one batch per request
+    Network errors and other failures stop the upload (retried next
+    cycle); a 404 from the batch endpoint falls back to single-record
+    uploads, and a 400 retries that batch one record at a time so only
+    the records the server refuses are set aside
+
+    Args:
+        records: List of cached records
+
+    Returns:
+        int: Number of leading records handled (uploaded or rejected)
+    """
+    global _batch_supported
+
+    if not _batch_supported:
+        return _upload_one_by_one(records)
+
+    synced = 0
+    while synced < len(records):
+        batch = records[synced:synced + SYNC_BATCH_SIZE]
+
+        try:
+            # POST the batch of records in a single request
+            response = _session.post(
+                API_LOG_BATCH,
+                data=_dumps({"records": batch}).encode(),
+                headers=_JSON_HEADERS,
+                timeout=10
+            )
+        except requests.RequestException as e:
+            print(f"Error syncing records: {e}")
+            break
+
+        if response.status_code == 404:
+            print("Batch endpoint not found, uploading records one at a time")
+            _batch_supported = False
+            return synced + _upload_one_by_one(records[synced:])
+
+        if response.status_code == 400:
+            # The API rejects the whole batch for one invalid record
+            print("Batch rejected, retrying its records one at a time")
+            handled = _upload_one_by_one(batch)
+            synced += handled
+            if handled < len(batch):
+                break
+            continue
+
+        if response.status_code != 200:
+            print(f"Failed to sync records (status {response.status_code})")
+            break
+
+        synced += len(batch)
+        print(f"Synced {len(batch)} records")
+
+    return synced
+
+
 def _sync_worker():
     """
     Background worker that continuously syncs cached records to the API
@@ -152,10 +503,16 @@ def _sync_worker():
 
     print("Sync thread started")
 
+    # Doubled after every offline cycle (up to SYNC_MAX_INTERVAL_SECONDS),
+    # so an offline device doesn't retry every few seconds
+    interval = SYNC_INTERVAL_SECONDS
+
     while _sync_running:
         try:
             # Check internet connectivity
             if has_internet():
+                interval = SYNC_INTERVAL_SECONDS
+
                 # Fetch fresh stats from API (non-blocking for detection service)
                 new_stats = fetch_stats()
                 if new_stats is not None:
@@ -163,62 +520,27 @@ def _sync_worker():
                         _latest_stats = new_stats
                     print(f"Stats refreshed: {_latest_stats}")
 
-                # Sync cached records
+                # Sync cached records, oldest first, one batch per request
                 cache = load_cache()
-
                 if cache:
                     print(f"Syncing {len(cache)} cached records...")
-                    updated_cache = []
-
-                    for record in cache:
-                        try:
-                            # Attempt to POST record to API
-                            response = requests.post(
-                                API_LOG,
-                                json=record,
-                                timeout=5
-                            )
-
-                            if response.status_code == 200:
-                                print(f"Synced record: {record['timestamp']}")
-                                # Successfully synced, don't keep it
-                            else:
-                                print(
-                                    f"Failed to sync record (status {response.status_code})")
-                                updated_cache.append(record)
-
-                        except requests.RequestException as e:
-                            print(f"Error syncing record: {e}")
-                            updated_cache.append(record)
-
-                    # Reload cache to preserve any records added during sync
-                    current_cache = load_cache()
-                    # Get timestamps of records that failed to sync (still need to retry)
-                    failed_timestamps = set(r['timestamp']
-                                            for r in updated_cache)
-                    # Get timestamps of original records we attempted to sync
-                    attempted_timestamps = set(r['timestamp'] for r in cache)
-
-                    # Keep records that either:
-                    # 1. Failed to sync (in failed_timestamps), OR
-                    # 2. Were added during sync (NOT in attempted_timestamps)
-                    final_cache = [
-                        r for r in current_cache
-                        if r['timestamp'] in failed_timestamps or r['timestamp'] not in attempted_timestamps
-                    ]
-
-                    # Save updated cache (only successfully synced records removed)
-                    save_cache(final_cache)
-
-                    if len(final_cache) < len(cache):
-                        print(
-                            f"Sync complete. {len(final_cache)} records remain in cache.")
+
+                synced = _upload_records(cache)
+
+                if synced:
+                    # Remove only the handled records; anything added during
+                    # the sync or left over after a failure stays cached
+                    remove_synced_records(synced)
+                    print(
+                        f"Sync complete. {get_unsynced_count()} records remain in cache.")
+            else:
+                interval = min(interval * 2, SYNC_MAX_INTERVAL_SECONDS)
 
         except Exception as e:
             print(f"Sync thread error: {e}")
 
         # Sleep before next sync attempt
-        time.sleep(SYNC_INTERVAL_SECONDS)
+        time.sleep(interval)
 
     print("Sync thread stopped")
 
@@ -227,12 +549,20 @@ def start_sync_thread():
     """
     Start the background sync thread
     """
-    global _sync_thread, _sync_running
+    global _sync_thread, _sync_running, _writer_thread
 
     if _sync_thread is not None and _sync_thread.is_alive():
         print("Sync thread already running")
         return
 
+    # Repair/migrate the cache file before syncing starts
+    prepare_cache()
+
+    # Start the cache writer first so queued detections reach the file
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_cache_writer, daemon=True)
+        _writer_thread.start()
+
     _sync_running = True
     _sync_thread = threading.Thread(target=_sync_worker, daemon=True)
     _sync_thread.start()
@@ -241,6 +571,29 @@ def start_sync_thread():
 def stop_sync_thread():
     """
     Stop the background sync thread
+    Waits (up to RECORD_FLUSH_TIMEOUT_SECONDS) for queued records to be
+    written to the cache file, then writes any still queued directly
     """
     global _sync_running
     _sync_running = False
+
+    if _writer_thread is None:
+        return
+
+    with _record_queue.all_tasks_done:
+        _record_queue.all_tasks_done.wait_for(
+            lambda: not _record_queue.unfinished_tasks,
+            RECORD_FLUSH_TIMEOUT_SECONDS)
+
+    records = []
+    while True:
+        try:
+            records.append(_record_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    if records:
+        print(f"Cache writer stalled, writing {len(records)} records directly")
+        _append_records(records)
+        for _ in records:
+            _record_queue.task_done()
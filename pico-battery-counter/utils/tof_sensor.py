@@ -3,18 +3,62 @@ VL6180X Time-of-Flight Sensor Module for Raspberry Pi
 Handles I2C communication and distance-based detection
 """
 
+import threading
 import time
 try:
     import smbus2 as smbus
+    from smbus2 import i2c_msg
 except ImportError:
     import smbus
+    i2c_msg = None
 
 try:
     import RPi.GPIO as GPIO
 except ImportError:
     GPIO = None
 
-from config import TOF_I2C_BUS, TOF_ADDRESS, TOF_XSHUT_PIN, TOF_THRESHOLD_MM
+from config import (
+    TOF_I2C_BUS, TOF_ADDRESS, TOF_XSHUT_PIN, TOF_THRESHOLD_MM, TOF_INT_PIN
+)
+
+# Poll interval used by wait_for_press() without the GPIO1 interrupt
+# (matches the sensor's 10ms inter-measurement period)
+FALLBACK_POLL_SECONDS = 0.01
+
+# Mandatory register settings from the VL6180X datasheet, loaded when the
+# sensor is fresh out of reset: (16-bit register, value)
+VL6180X_DEFAULT_SETTINGS = (
+    (0x0207, 0x01),
+    (0x0208, 0x01),
+    (0x0096, 0x00),
+    (0x0097, 0xFD),
+    (0x00e3, 0x00),
+    (0x00e4, 0x04),
+    (0x00e5, 0x02),
+    (0x00e6, 0x01),
+    (0x00e7, 0x03),
+    (0x00f5, 0x02),
+    (0x00D9, 0x05),
+    (0x00DB, 0xCE),
+    (0x00DC, 0x03),
+    (0x00DD, 0xF8),
+    (0x009f, 0x00),
+    (0x00a3, 0x3c),
+    (0x00b7, 0x00),
+    (0x00bb, 0x3c),
+    (0x00b2, 0x09),
+    (0x00ca, 0x09),
+    (0x0198, 0x01),
+    (0x01b0, 0x17),
+    (0x01ad, 0x00),
+    (0x00FF, 0x05),
+    (0x0100, 0x05),
+    (0x0199, 0x05),
+    (0x01a6, 0x1b),
+    (0x01ac, 0x3e),
+    (0x01a7, 0x1f),
+    (0x0030, 0x00),
+)
 
 
 class TOFSensor:
@@ -25,15 +69,17 @@ class TOFSensor:
 
     # Key register addresses
     REG_IDENTIFICATION_MODEL_ID = 0x000
+    REG_SYSTEM_MODE_GPIO1 = 0x011
     REG_SYSTEM_INTERRUPT_CONFIG = 0x014
     REG_SYSTEM_INTERRUPT_CLEAR = 0x015
     REG_SYSTEM_FRESH_OUT_OF_RESET = 0x016
     REG_SYSRANGE_START = 0x018
+    REG_SYSRANGE_INTERMEASUREMENT_PERIOD = 0x01B
     REG_RESULT_RANGE_STATUS = 0x04D
     REG_RESULT_INTERRUPT_STATUS_GPIO = 0x04F
     REG_RESULT_RANGE_VAL = 0x062
 
-    def __init__(self, bus_number=TOF_I2C_BUS, address=TOF_ADDRESS, xshut_pin=TOF_XSHUT_PIN, threshold_mm=TOF_THRESHOLD_MM):
+    def __init__(self, bus_number=TOF_I2C_BUS, address=TOF_ADDRESS, xshut_pin=TOF_XSHUT_PIN, threshold_mm=TOF_THRESHOLD_MM, int_pin=TOF_INT_PIN):
         """
         Initialize VL6180X sensor
 
@@ -42,6 +88,7 @@ class TOFSensor:
             address: I2C address of the sensor (default 0x29)
             xshut_pin: GPIO pin for XSHUT (required for sensor activation)
             threshold_mm: Distance threshold in millimeters
+            int_pin: GPIO pin wired to the sensor's GPIO1 output, or None to poll
         """
         self.bus_number = bus_number
         self.address = address
@@ -49,8 +96,16 @@ class TOFSensor:
         self.threshold_mm = threshold_mm
         self.gpio_enabled = False
         self.last_state = False  # False = no object, True = object detected
-        self.last_trigger_time = 0
-        self.debounce_time = 0.15  # 150ms debounce
+        self.last_trigger_ns = 0
+        self.debounce_ns = 150_000_000  # 150ms debounce
+
+        # Detections caught by the GPIO1 interrupt but not yet returned by
+        # check(); the event is set while any are pending
+        self.int_pin = int_pin
+        self.use_interrupts = False
+        self._pending_detections = 0
+        self._pending_lock = threading.Lock()
+        self._detect_event = threading.Event()
 
         # Setup XSHUT pin to enable sensor
         if GPIO is not None and self.xshut_pin is not None:
@@ -78,6 +133,19 @@ class TOFSensor:
 
         # Initialize I2C bus
         self.bus = smbus.SMBus(bus_number)
+
+        # read_distance() sets the register pointer and reads the range in
+        # one I2C_RDWR transfer (write then read - the read has to be the
+        # last message); the messages are built once and reused
+        self._range_msgs = None
+        if i2c_msg is not None:
+            self._range_msgs = (
+                i2c_msg.write(self.address, [
+                    (self.REG_RESULT_RANGE_VAL >> 8) & 0xFF,
+                    self.REG_RESULT_RANGE_VAL & 0xFF]),
+                i2c_msg.read(self.address, 1),
+            )
+
         print(
             f"TOF Sensor: VL6180X initialized on I2C bus {bus_number}, address 0x{address:02X}")
         print(f"TOF Sensor: Detection threshold set to {threshold_mm}mm")
@@ -85,6 +153,17 @@ class TOFSensor:
         # Initialize sensor
         self._init_sensor()
 
+        # Read each sample when GPIO1 signals it is ready instead of polling
+        if GPIO is not None and self.int_pin is not None:
+            try:
+                GPIO.setup(self.int_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+                GPIO.add_event_detect(self.int_pin, GPIO.FALLING,
+                                      callback=self._on_sample)
+                self.use_interrupts = True
+                print(f"TOF Sensor: Sample interrupt on GPIO {self.int_pin}")
+            except RuntimeError as e:
+                print(f"TOF Sensor: Edge detection unavailable ({e}), polling instead")
+
     def _write_byte(self, register, data):
         """Write a byte to a 16-bit register address"""
         self.bus.write_i2c_block_data(
@@ -102,6 +181,29 @@ class TOFSensor:
         )
         return self.bus.read_byte(self.address)
 
+    def _write_settings(self, settings):
+        """
+        Write a list of register values in a single I2C_RDWR transfer
+        (one syscall), falling back to one write per register
+
+        Args:
+            settings: Iterable of (16-bit register, value) pairs
+        """
+        if i2c_msg is not None:
+            messages = [
+                i2c_msg.write(self.address,
+                              [(register >> 8) & 0xFF, register & 0xFF, data])
+                for register, data in settings
+            ]
+            try:
+                self.bus.i2c_rdwr(*messages)
+                return
+            except OSError as e:
+                print(f"TOF Sensor: Batched write failed ({e}), writing registers one by one")
+
+        for register, data in settings:
+            self._write_byte(register, data)
+
     def _init_sensor(self):
         """Initialize the sensor with required settings"""
         try:
@@ -113,36 +215,7 @@ class TOFSensor:
                 print("TOF Sensor: Loading default settings...")
 
                 # Load mandatory register settings from datasheet
-                self._write_byte(0x0207, 0x01)
-                self._write_byte(0x0208, 0x01)
-                self._write_byte(0x0096, 0x00)
-                self._write_byte(0x0097, 0xFD)
-                self._write_byte(0x00e3, 0x00)
-                self._write_byte(0x00e4, 0x04)
-                self._write_byte(0x00e5, 0x02)
-                self._write_byte(0x00e6, 0x01)
-                self._write_byte(0x00e7, 0x03)
-                self._write_byte(0x00f5, 0x02)
-                self._write_byte(0x00D9, 0x05)
-                self._write_byte(0x00DB, 0xCE)
-                self._write_byte(0x00DC, 0x03)
-                self._write_byte(0x00DD, 0xF8)
-                self._write_byte(0x009f, 0x00)
-                self._write_byte(0x00a3, 0x3c)
-                self._write_byte(0x00b7, 0x00)
-                self._write_byte(0x00bb, 0x3c)
-                self._write_byte(0x00b2, 0x09)
-                self._write_byte(0x00ca, 0x09)
-                self._write_byte(0x0198, 0x01)
-                self._write_byte(0x01b0, 0x17)
-                self._write_byte(0x01ad, 0x00)
-                self._write_byte(0x00FF, 0x05)
-                self._write_byte(0x0100, 0x05)
-                self._write_byte(0x0199, 0x05)
-                self._write_byte(0x01a6, 0x1b)
-                self._write_byte(0x01ac, 0x3e)
-                self._write_byte(0x01a7, 0x1f)
-                self._write_byte(0x0030, 0x00)
+                self._write_settings(VL6180X_DEFAULT_SETTINGS)
 
                 # Clear fresh out of reset flag
                 self._write_byte(self.REG_SYSTEM_FRESH_OUT_OF_RESET, 0x00)
@@ -150,13 +223,21 @@ class TOFSensor:
             else:
                 print("TOF Sensor: Already initialized")
 
+            # Drive GPIO1 low as an interrupt output (active low)
+            self._write_byte(self.REG_SYSTEM_MODE_GPIO1, 0x10)
+
             # Configure interrupt system for range measurements
             # Enable range interrupt on new sample ready (bit 2)
             self._write_byte(self.REG_SYSTEM_INTERRUPT_CONFIG, 0x04)
             
             # Clear any pending interrupts
             self._write_byte(self.REG_SYSTEM_INTERRUPT_CLEAR, 0x07)
-            
+
+            # Range continuously, one measurement every 10ms ((9 + 1) * 10ms),
+            # so read_distance() only has to fetch the latest result
+            self._write_byte(self.REG_SYSRANGE_INTERMEASUREMENT_PERIOD, 9)
+            self._write_byte(self.REG_SYSRANGE_START, 0x03)
+
             # Wait for sensor to stabilize after configuration
             time.sleep(0.05)
 
@@ -172,23 +253,18 @@ class TOFSensor:
             int: Distance in millimeters, or -1 on error
         """
         try:
-            # Start a single-shot range measurement
-            self._write_byte(self.REG_SYSRANGE_START, 0x01)
-
-            # Wait for measurement to complete (poll interrupt status)
-            timeout = 100  # 100ms timeout
-            start_time = time.time()
-
-            while (time.time() - start_time) < (timeout / 1000.0):
-                status = self._read_byte(self.REG_RESULT_INTERRUPT_STATUS_GPIO)
-                if (status & 0x04) != 0:  # Check if range measurement is ready
-                    break
-                time.sleep(0.001)  # 1ms delay
-            else:
-                return -1
+            # Sensor is in continuous mode - the latest result is always ready
+            distance = None
+            if self._range_msgs is not None:
+                try:
+                    self.bus.i2c_rdwr(*self._range_msgs)
+                    distance = bytes(self._range_msgs[1])[0]
+                except OSError as e:
+                    print(f"TOF Sensor: Combined read failed ({e}), using separate transfers")
+                    self._range_msgs = None
 
-            # Read the distance value
-            distance = self._read_byte(self.REG_RESULT_RANGE_VAL)
+            if distance is None:
+                distance = self._read_byte(self.REG_RESULT_RANGE_VAL)
 
             # Clear the interrupt
             self._write_byte(self.REG_SYSTEM_INTERRUPT_CLEAR, 0x07)
@@ -199,17 +275,17 @@ class TOFSensor:
             print(f"TOF Sensor: Error reading distance: {e}")
             return -1
 
-    def check(self):
+    def _detect(self, distance):
         """
-        Non-blocking check for object detection based on threshold
+        Apply the threshold and debounce to a new distance sample
+
+        Args:
+            distance: Distance in millimeters, or -1 on error
 
         Returns:
             bool: True if a new object is detected within threshold, False otherwise
         """
-        current_time = time.monotonic()
-
-        # Read current distance
-        distance = self.read_distance()
+        now_ns = time.monotonic_ns()
 
         # Determine current state
         current_state = (
@@ -218,8 +294,8 @@ class TOFSensor:
         # Detect transition from no object to object detected
         if not self.last_state and current_state:
             # Check debounce timing
-            if (current_time - self.last_trigger_time) >= self.debounce_time:
-                self.last_trigger_time = current_time
+            if now_ns - self.last_trigger_ns >= self.debounce_ns:
+                self.last_trigger_ns = now_ns
                 self.last_state = current_state
                 print(
                     f"TOF Sensor: Object detected at {distance}mm (threshold: {self.threshold_mm}mm)")
@@ -228,6 +304,54 @@ class TOFSensor:
         self.last_state = current_state
         return False
 
+    def _on_sample(self, channel):
+        """GPIO1 interrupt callback - runs on the RPi.GPIO event thread"""
+        if self._detect(self.read_distance()):
+            with self._pending_lock:
+                self._pending_detections += 1
+                self._detect_event.set()
+
+    def check(self):
+        """
+        Non-blocking check for object detection based on threshold
+
+        Returns:
+            bool: True if a new object is detected within threshold, False otherwise
+        """
+        if not self.use_interrupts:
+            return self._detect(self.read_distance())
+
+        with self._pending_lock:
+            if self._pending_detections == 0:
+                # Also clears a wake() request
+                self._detect_event.clear()
+                return False
+            self._pending_detections -= 1
+            if self._pending_detections == 0:
+                self._detect_event.clear()
+        return True
+
+    def wait_for_press(self, timeout):
+        """
+        Block until a detection is pending or the timeout expires
+        Does not consume the detection - call check() afterwards
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if woken early, False on timeout
+        """
+        if self.use_interrupts:
+            return self._detect_event.wait(timeout)
+
+        # Polling - check() samples the sensor, so just pace the loop
+        return self._detect_event.wait(min(FALLBACK_POLL_SECONDS, timeout))
+
+    def wake(self):
+        """Release a blocked wait_for_press() early (e.g. on shutdown)"""
+        self._detect_event.set()
+
     def get_model_id(self):
         """
         Read the model ID (should be 0xB4 for VL6180X)
@@ -259,6 +383,15 @@ class TOFSensor:
         """
         Close I2C bus connection and cleanup GPIO
         """
+        if self.use_interrupts:
+            GPIO.remove_event_detect(self.int_pin)
+
+        try:
+            # Writing the start bit again stops continuous ranging
+            self._write_byte(self.REG_SYSRANGE_START, 0x01)
+        except Exception as e:
+            print(f"TOF Sensor: Error stopping ranging: {e}")
+
         try:
             self.bus.close()
             if self.gpio_enabled and GPIO is not None: